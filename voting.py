@@ -1,9 +1,35 @@
-import pandas as pd
-import random
 import csv
+import calendar
 from datetime import datetime
-import matplotlib.pyplot as plt
-from functools import wraps
+from collections import Counter
+from itertools import islice
+
+
+# "Jan" -> 1, ..., "Dec" -> 12 (used instead of strptime in set_voting_period)
+_MONTHS = {abbr: number for number, abbr in enumerate(calendar.month_abbr) if abbr}
+
+# reasons a vote can be rejected (see Election._vote_rejection)
+_NOT_ELIGIBLE = "not_eligible"
+_ALREADY_VOTED = "already_voted"
+_UNKNOWN_CANDIDATE = "unknown_candidate"
+
+
+def _parse_month_day(date_str):
+    """
+    Parse a string like 'Oct 12' into a datetime (year 1900, same as strptime).
+    Raises ValueError if the format is wrong.
+    """
+    try:
+        month_str, day_str = date_str.split()
+        month = _MONTHS[month_str.title()]
+    except (ValueError, KeyError):
+        raise ValueError(f"Invalid date: {date_str!r}") from None
+
+    # be as strict as strptime: 1-2 plain digits for the day, no extra spaces
+    if (date_str != date_str.strip() or not (day_str.isascii() and day_str.isdigit())
+            or len(day_str) > 2):
+        raise ValueError(f"Invalid date: {date_str!r}")
+    return datetime(1900, month, int(day_str))
 
 
 def create_initial_data(voters_filename='voters.csv', candidates_filename='candidates.txt', total_voters=500):
@@ -14,18 +40,11 @@ def create_initial_data(voters_filename='voters.csv', candidates_filename='candi
     - candidates.txt -> one candidate name per line
     """
 
-    # make a simple voters list
-    voters = []
-    for i in range(1, total_voters + 1):
-        voter_id = f"VOTER{i:03d}"
-        status = "Registered"
-        voters.append([voter_id, status])
-
-    # write voters file
+    # write voters file (rows are generated on the fly, no list needed)
     with open(voters_filename, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(["Voter_ID", "Status"])
-        writer.writerows(voters)
+        writer.writerows(("VOTER%03d" % i, "Registered") for i in range(1, total_voters + 1))
 
     # just hardcoding 3 candidates for now
     candidates = ["Alice Kumar", "Bob Singh", "Charlie Patel"]
@@ -34,32 +53,20 @@ def create_initial_data(voters_filename='voters.csv', candidates_filename='candi
             f.write(name + "\n")
 
 
-# decorator for confirming vote (sort of "automation" feature)
-def voting_confirmation(func):
-    """
-    Wrapper that prints a confirmation message only when the vote succeeds.
-    """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        result = func(*args, **kwargs)
-
-        if result:
-            print(f"✨ CONFIRMED: Vote for {args[2]} successfully logged by {args[1]}.")
-        return result
-
-    return wrapper
-
 class Candidate:
     """
     Represents a single candidate and keeps track of their vote count.
     """
 
+    # only these two fields, so no per-instance __dict__
+    __slots__ = ("name", "_vote_count")
+
     def __init__(self, name):
         self.name = name
         self._vote_count = 0
 
-    def add_vote(self):
-        self._vote_count += 1
+    def add_vote(self, count=1):
+        self._vote_count += count
 
     def get_vote_count(self):
         return self._vote_count
@@ -78,11 +85,17 @@ class Election:
         self.voting_period = None
         self.candidates = {}  # name -> Candidate object
 
-        # load voters from CSV
-        self.eligible_voters = pd.read_csv(voters_file)
+        # load voters from CSV -> {Voter_ID: Status}
+        with open(voters_file, "r", newline="") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # skip header (an empty file just means no voters)
+            # skip blank lines like read_csv did; a missing Status is kept as ""
+            self.eligible_voters = {row[0]: (row[1] if len(row) > 1 else "") for row in reader if row}
         self.voted_voters = set()
 
         self.total_eligible_voters = len(self.eligible_voters)
+        # votes -> turnout % factor (0 if nobody is registered)
+        self._turnout_scale = (100.0 / self.total_eligible_voters) if self.total_eligible_voters else 0.0
         self.total_votes_cast = 0
 
         self._load_candidates(candidates_file)
@@ -93,10 +106,8 @@ class Election:
         """
         try:
             with open(filename, "r") as f:
-                for line in f:
-                    name = line.strip()
-                    if name:
-                        self.candidates[name] = Candidate(name)
+                names = [line.strip() for line in f.read().splitlines()]
+            self.candidates.update({name: Candidate(name) for name in names if name})
         except FileNotFoundError:
             print(f"Error: Candidate file {filename} not found.")
 
@@ -105,48 +116,102 @@ class Election:
         Set the voting period. Example: 'Oct 12' to 'Oct 14'
         This is more for display; we are not enforcing dates in code.
         """
-        date_format = "%b %d"
         try:
-            start_date = datetime.strptime(start_date_str, date_format)
-            end_date = datetime.strptime(end_date_str, date_format)
+            start_date = _parse_month_day(start_date_str)
+            end_date = _parse_month_day(end_date_str)
             self.voting_period = (start_date, end_date)
         except ValueError:
             print("Error: Date format should be like 'Oct 12'.")
 
-    @voting_confirmation
-    def cast_vote(self, voter_id, candidate_name):
+    def cast_vote(self, voter_id, candidate_name, confirm=False):
         """
         Cast a vote:
         - checks if voter is in the eligible list
         - prevents double voting
         - checks if candidate exists
+        If confirm is True, prints a confirmation message when the vote succeeds.
         Returns True if vote was recorded, False otherwise.
         """
 
-        # check voter is registered
-        if voter_id not in self.eligible_voters["Voter_ID"].values:
+        rejection = self._vote_rejection(voter_id, candidate_name)
+
+        # messages are only built here, when they are actually printed
+        if rejection == _NOT_ELIGIBLE:
             print(f"🗳️ VOTE REJECTED: Voter ID {voter_id} is not eligible.")
             return False
+        if rejection == _ALREADY_VOTED:
+            print(f"🗳️ VOTE REJECTED: Voter ID {voter_id} has already cast a vote.")
+            return False
+        if rejection == _UNKNOWN_CANDIDATE:
+            print(f"🗳️ VOTE REJECTED: Candidate '{candidate_name}' is not running.")
+            return False
+
+        self._add_vote(voter_id, candidate_name)
+
+        if confirm:
+            print(f"✨ CONFIRMED: Vote for {candidate_name} successfully logged by {voter_id}.")
+        return True
+
+    def record_votes(self, pairs):
+        """
+        Record many (voter_id, candidate_name) votes quietly, in one go.
+        Every pair gets the same checks as cast_vote (a voter listed twice in
+        the batch only counts once); invalid pairs are skipped.
+        Returns how many votes were recorded.
+        """
+        accepted_voters = []
+        accepted_candidates = []
+        batch_voters = set()
+
+        for voter_id, candidate_name in pairs:
+            if voter_id in batch_voters or self._vote_rejection(voter_id, candidate_name) is not None:
+                continue
+            batch_voters.add(voter_id)
+            accepted_voters.append(voter_id)
+            accepted_candidates.append(candidate_name)
+
+        # nothing has been changed so far, tally the valid votes in one step
+        for name, count in Counter(accepted_candidates).items():
+            self.candidates[name].add_vote(count)
+        self.voted_voters.update(accepted_voters)
+        self.total_votes_cast += len(accepted_voters)
+
+        return len(accepted_voters)
+
+    def _vote_rejection(self, voter_id, candidate_name):
+        """
+        Checks a vote without changing anything.
+        Returns the reason it would be rejected (one of the _NOT_ELIGIBLE /
+        _ALREADY_VOTED / _UNKNOWN_CANDIDATE codes), or None if it is valid.
+        """
+
+        # check voter is registered
+        if voter_id not in self.eligible_voters:
+            return _NOT_ELIGIBLE
 
         # prevent duplicates
         if voter_id in self.voted_voters:
-            print(f"🗳️ VOTE REJECTED: Voter ID {voter_id} has already cast a vote.")
-            return False
+            return _ALREADY_VOTED
 
         # check candidate name
         if candidate_name not in self.candidates:
-            print(f"🗳️ VOTE REJECTED: Candidate '{candidate_name}' is not running.")
-            return False
+            return _UNKNOWN_CANDIDATE
 
-        # if everything is fine, record the vote
+        return None
+
+    def _add_vote(self, voter_id, candidate_name):
+        """
+        Record an already checked vote.
+        """
         self.candidates[candidate_name].add_vote()
         self.voted_voters.add(voter_id)
         self.total_votes_cast += 1
 
-        return True
-
-    # simple lambda to compute turnout (%)
-    calculate_turnout = lambda self: (self.total_votes_cast / self.total_eligible_voters) * 100 if self.total_eligible_voters > 0 else 0
+    def calculate_turnout(self):
+        """
+        Turnout as a percentage of eligible voters.
+        """
+        return self.total_votes_cast * self._turnout_scale
 
     def generate_results(self):
         """
@@ -156,27 +221,29 @@ class Election:
         - Percentage
         Also returns winner, turnout and abstentions.
         """
+        import pandas as pd  # imported here so loading this module stays cheap
+
+        # sort with plain Python, it's only a handful of candidates
+        items = [(name, candidate.get_vote_count()) for name, candidate in self.candidates.items()]
+        items.sort(key=lambda item: item[1], reverse=True)
 
         data = []
-        for name, candidate in self.candidates.items():
-            votes = candidate.get_vote_count()
+        for name, votes in items:
             if self.total_votes_cast > 0:
                 percentage = (votes / self.total_votes_cast) * 100
             else:
                 percentage = 0
             data.append([name, votes, percentage])
 
-        results_df = pd.DataFrame(data, columns=["Candidate", "Votes", "Percentage"])
-        results_df = results_df.sort_values(by="Votes", ascending=False).reset_index(drop=True)
-
-        if not results_df.empty:
-            winner_row = results_df.iloc[0]
-            winner_name = winner_row["Candidate"]
-            winner_percent = winner_row["Percentage"]
+        if data:
+            winner_name, _, winner_percent = data[0]
         else:
             winner_name = "N/A"
             winner_percent = 0.0
 
+        # DataFrame is only built for the report table and the charts
+        results_df = pd.DataFrame(data, columns=["Candidate", "Votes", "Percentage"])
+
         turnout_value = self.calculate_turnout()
         abstentions = self.total_eligible_voters - self.total_votes_cast
 
@@ -187,28 +254,40 @@ class Election:
             "abstentions": abstentions
         }
 
-def plot_results(results_df, election_name, total_votes_cast):
+def format_results_table(results_df):
     """
-    Make a bar chart and pie chart from the results DataFrame.
+    Turn the results DataFrame into a small markdown table
+    (done by hand so we don't need 'tabulate' for to_markdown).
     """
+    lines = ["| Candidate | Votes | Percentage |", "|:---|---:|---:|"]
+    for name, votes, percentage in results_df.itertuples(index=False):
+        lines.append(f"| {name} | {votes} | {percentage:.1f} |")
+    return "\n".join(lines)
+
+def plot_results(results_df, election_name, total_votes_cast, output_file="election_results.png"):
+    """
+    Make a bar chart and pie chart (side by side in one figure) from the results DataFrame
+    and save it as an image.
+    """
+    # imported here so runs/imports that never plot don't pay for matplotlib
+    import matplotlib.pyplot as plt
+
+    fig, (bar_ax, pie_ax) = plt.subplots(1, 2, figsize=(16, 6))
 
     # Bar chart for number of votes
-    plt.figure(figsize=(10, 6))
-    plt.bar(results_df["Candidate"], results_df["Votes"], color=["teal", "skyblue", "salmon"])
-    plt.xlabel("Candidate")
-    plt.ylabel("Number of Votes")
-    plt.title(f"Vote Distribution Comparison for {election_name}")
+    bars = bar_ax.bar(results_df["Candidate"], results_df["Votes"], color=["teal", "skyblue", "salmon"])
+    bar_ax.set_xlabel("Candidate")
+    bar_ax.set_ylabel("Number of Votes")
+    bar_ax.set_title(f"Vote Distribution Comparison for {election_name}")
 
     # show the percentage above each bar
-    for i, row in results_df.iterrows():
-        plt.text(i, row["Votes"] + 5, f"{row['Percentage']:.1f}%", ha="center")
+    percentages = results_df["Percentage"].to_numpy()
+    bar_ax.bar_label(bars, labels=[f"{p:.1f}%" for p in percentages], padding=3)
 
-    plt.grid(axis="y", linestyle="--")
-    plt.show()
+    bar_ax.grid(axis="y", linestyle="--")
 
     # Pie chart for vote percentages
-    plt.figure(figsize=(8, 8))
-    plt.pie(
+    pie_ax.pie(
         results_df["Votes"],
         labels=results_df["Candidate"],
         autopct="%1.1f%%",
@@ -216,8 +295,12 @@ def plot_results(results_df, election_name, total_votes_cast):
         colors=["teal", "skyblue", "salmon"],
         explode=(0.05, 0, 0)
     )
-    plt.title(f"Overall Vote Share ({total_votes_cast} Votes Cast)")
-    plt.show()
+    pie_ax.set_title(f"Overall Vote Share ({total_votes_cast} Votes Cast)")
+
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=100)
+    plt.close(fig)
+    print(f"Charts saved to {output_file}")
 
 def main():
     """
@@ -227,6 +310,11 @@ def main():
     - prints report
     - generates charts
     """
+    # the script runs headless and saves its charts, so pick the Agg backend here
+    # (not in plot_results, to leave other callers' backend alone)
+    import matplotlib
+    matplotlib.use("Agg")
+    import numpy as np
 
     VOTERS_FILE = "voters.csv"
     CANDIDATES_FILE = "candidates.txt"
@@ -245,32 +333,32 @@ def main():
     # 2. Simulate votes (450 total: 200 Alice, 150 Bob, 100 Charlie)
     print("\n--- 2. Starting Vote Casting Simulation ---")
 
-    voter_ids = council_election.eligible_voters["Voter_ID"].tolist()
-
     vote_targets = {
         "Alice Kumar": 200,
         "Bob Singh": 150,
         "Charlie Patel": 100
     }
 
-    # create a list like ["Alice", "Alice", ..., "Bob", ...]
-    vote_list = []
-    for candidate_name, count in vote_targets.items():
-        for _ in range(count):
-            vote_list.append(candidate_name)
+    # create a list like ["Alice", "Alice", ..., "Bob", ...] and shuffle it (numpy does both in C)
+    names = np.array(list(vote_targets.keys()))
+    counts = np.array(list(vote_targets.values()))
+    vote_arr = np.repeat(names, counts)
+    rng = np.random.default_rng()
+    rng.shuffle(vote_arr)
+    vote_list = vote_arr.tolist()
 
-    random.shuffle(vote_list)
+    # first 450 registered voters (no full copy of the ID list)
+    voters_to_cast = islice(council_election.eligible_voters, 450)
 
-    voters_to_cast = voter_ids[:450]
+    vote_pairs = list(zip(voters_to_cast, vote_list))
 
     print("Casting votes (showing confirmation for first 5):")
-    for i, (voter_id, candidate_name) in enumerate(zip(voters_to_cast, vote_list)):
-        if i < 5:
-            # normal decorated call (prints confirmation on success)
-            council_election.cast_vote(voter_id, candidate_name)
-        else:
-            # call the original function without decorator to avoid spammy output
-            council_election.cast_vote.__wrapped__(council_election, voter_id, candidate_name)
+    for voter_id, candidate_name in vote_pairs[:5]:
+        # normal call (prints confirmation on success)
+        council_election.cast_vote(voter_id, candidate_name, confirm=True)
+
+    # the rest go through the same checks as a batch, without the output
+    council_election.record_votes(vote_pairs[5:])
 
     # 3. Final results and summary
     final_results = council_election.generate_results()
@@ -284,8 +372,7 @@ def main():
     print("Voting Period: Active (Polls Close: Oct 14, 5:00 PM)")
 
     print("\n--- LIVE RESULTS TABLE ---")
-    # to_markdown needs 'tabulate' installed: pip install tabulate
-    print(results_df.to_markdown(index=False, floatfmt=".1f"))
+    print(format_results_table(results_df))
 
     print("\n--- ELECTION METRICS ---")
     print(f"Voter Turnout: {final_results['turnout']:.1f}%")